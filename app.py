@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 from datetime import date, datetime
 import os
+import tempfile
 import time
 import random
 
@@ -18,30 +19,168 @@ st.markdown("""
 
 # Filepath for stored habits, lets the user update their morning routine
 HABITS_FILE = 'habits.txt'
+DEFAULT_HABITS = ["Drink water", "Exercise eg. Yoga", "Meditate", "Journal", "Affirmations"]
+
+
+# Registry that keeps every habit under a stable ID, with a hash index on the normalized name
+class HabitRegistry:
+    """Ordered habit store with O(1) lookups by name and support for retiring habits.
+
+    On disk every habit is one line: ``<id>\t<status>\t<name>`` where status is ``+`` (active)
+    or ``-`` (retired). Plain lines holding only a name (the old format) are still accepted.
+    """
+
+    ACTIVE = '+'
+    RETIRED = '-'
+
+    def __init__(self):
+        self.names = {}  # id -> display name, kept in insertion order
+        self.index = {}  # normalized name -> id
+        self.retired = set()
+        self.next_id = 1
+
+    @staticmethod
+    def normalize(name):
+        """Key used for deduplication, so "Drink water" and " drink  Water" are the same habit."""
+        return ' '.join(name.split()).casefold()
+
+    def __contains__(self, name):
+        habit_id = self.index.get(self.normalize(name))
+        return habit_id is not None and habit_id not in self.retired
+
+    def active_names(self):
+        return [name for habit_id, name in self.names.items() if habit_id not in self.retired]
+
+    def insert(self, name, habit_id=None):
+        """Insert a habit that is not known yet and return its ID, or None if the name is empty or taken."""
+        name = ' '.join(name.split())
+        key = self.normalize(name)
+        if not key or key in self.index:
+            return None
+        if habit_id is None or habit_id in self.names:
+            habit_id = self.next_id
+        self.next_id = max(self.next_id, habit_id + 1)
+        self.names[habit_id] = name
+        self.index[key] = habit_id
+        return habit_id
+
+    def add(self, name):
+        """Add a habit (or reactivate a retired one) and return its ID, or None if it already is active."""
+        existing = self.index.get(self.normalize(name))
+        if existing is None:
+            return self.insert(name)
+        if existing in self.retired:
+            self.retired.discard(existing)
+            return existing
+        return None
+
+    def retire(self, name):
+        """Hide a habit from the tracker while keeping its ID, returns False if it was not active."""
+        habit_id = self.index.get(self.normalize(name))
+        if habit_id is None or habit_id in self.retired:
+            return False
+        self.retired.add(habit_id)
+        return True
+
+    @classmethod
+    def from_lines(cls, lines, defaults=()):
+        """Build a registry where the IDs saved in the file win, defaults and old-format names only fill gaps."""
+        registry = cls()
+        legacy_names = []
+        for line in lines:
+            parts = line.rstrip('\n').split('\t', 2)
+            if len(parts) == 3 and parts[0].isdigit():
+                habit_id = registry.insert(parts[2], int(parts[0]))
+                if habit_id is not None and parts[1] == cls.RETIRED:
+                    registry.retired.add(habit_id)
+            else:
+                legacy_names.append(line)
+        for name in [*defaults, *legacy_names]:
+            registry.insert(name)
+        return registry
+
+    def to_lines(self):
+        for habit_id, name in self.names.items():
+            status = self.RETIRED if habit_id in self.retired else self.ACTIVE
+            yield f"{habit_id}\t{status}\t{name}\n"
+
+    def save(self, path):
+        """Rewrite the whole file, so duplicates never pile up, and swap it in atomically."""
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path) or '.', delete=False) as file:
+            file.writelines(self.to_lines())
+        try:
+            os.replace(file.name, path)
+        except OSError:
+            os.remove(file.name)
+            raise
+
+
+def habits_file_version(path):
+    """Cheap fingerprint of the habits file, changes whenever the file is rewritten."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    # save() swaps in a new file, so the inode changes even when size and mtime do not
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+# The file is only read again when its version changes, every other rerun hits the cache
+@st.cache_data(max_entries=1)
+def read_habit_lines(path, version):
+    """Read the raw lines of the habits file, the version argument is part of the cache key."""
+    if version is None:
+        return []
+    with open(path, 'r') as file:
+        return file.readlines()
 
 
 # Definition to load the activities from the Habits File and add them to the pre-programmed activities
 def load_habits():
-    """Load habits from the file, including any added by the user, merging with session state."""
-    if 'activities_list' not in st.session_state:
-        st.session_state.activities_list = ["Drink water", "Exercise eg. Yoga", "Meditate", "Journal",
-                                            "Affirmations"]  # Default habits
-    if os.path.exists(HABITS_FILE):
-        with open(HABITS_FILE, 'r') as file:
-            file_habits = file.read().split('\n')
-            for habit in file_habits:
-                if habit and habit not in st.session_state.activities_list:
-                    st.session_state.activities_list.append(habit)
+    """Load the habit registry into session state, rebuilding it only if the file changed since the last rerun."""
+    version = habits_file_version(HABITS_FILE)
+    if 'habit_registry' not in st.session_state or st.session_state.habits_version != version:
+        lines = read_habit_lines(HABITS_FILE, version)
+        st.session_state.habit_registry = HabitRegistry.from_lines(lines, DEFAULT_HABITS)
+        st.session_state.habits_version = version
+        st.session_state.activities_list = st.session_state.habit_registry.active_names()
+
+
+def save_habits(message):
+    """Persist the registry, then redraw the page so the form and selectbox show the updated habits."""
+    registry = st.session_state.habit_registry
+    registry.save(HABITS_FILE)
+    st.session_state.habits_version = habits_file_version(HABITS_FILE)
+    st.session_state.activities_list = registry.active_names()
+    # Kept in session state so the message survives the rerun
+    st.session_state.habit_message = message
+    st.rerun()
 
 
 # Definition to manipulate the Habit File, therefore to add new habits to morning routine
 def add_habit(new_habit):
-    """Add a new habit to the file and session state."""
-    if new_habit and new_habit not in st.session_state.activities_list:
-        with open(HABITS_FILE, 'a') as file:
-            file.write(f"{new_habit}\n")
-        st.session_state.activities_list.append(new_habit)
-        st.success(f"Added habit: {new_habit}")
+    """Add a new habit to the registry and the file, ignoring names that differ only in case or spacing."""
+    registry = st.session_state.habit_registry
+    if not new_habit:
+        return
+    if new_habit in registry:
+        st.info(f"\"{new_habit}\" is already part of your routine.")
+        return
+    # The name is not active, so if it is indexed it was retired and gets restored
+    restored = registry.normalize(new_habit) in registry.index
+    habit_id = registry.add(new_habit)
+    if habit_id is not None:
+        action = "Restored" if restored else "Added"
+        save_habits(f"{action} habit: {registry.names[habit_id]}")
+
+
+# Definition to remove a habit from the morning routine without losing its ID
+def retire_habit(habit):
+    """Retire a habit so it no longer shows up in the tracker."""
+    if not habit:
+        return
+    if st.session_state.habit_registry.retire(habit):
+        save_habits(f"Retired habit: {habit}")
 
 
 # Handling the Dataset for the morning routine
@@ -154,6 +293,14 @@ def track_morning():
     new_habit = st.text_input("Add a new morning habit:")
     if st.button("Add Habit"):
         add_habit(new_habit)
+    if 'habit_message' in st.session_state:
+        st.success(st.session_state.pop('habit_message'))
+
+    # Retiring a habit hides it from the tracker, adding it again later brings it back
+    if st.session_state.activities_list:
+        habit_to_retire = st.selectbox("Retire a morning habit:", st.session_state.activities_list)
+        if st.button("Retire Habit"):
+            retire_habit(habit_to_retire)
 
 
 # App Pages: Lets the User view the morning routine data